@@ -2,7 +2,224 @@
 
 from machine import I2C, Pin
 import time
-from pins import OLED_SDA, OLED_SCL, OLED_I2C_ID, OLED_I2C_FREQ, OLED_WIDTH, OLED_HEIGHT, OLED_ADDR
+import micropython
+from micropython import const
+from pins import (OLED_SDA, OLED_SCL, OLED_I2C_ID, OLED_I2C_FREQ, OLED_I2C_FALLBACK_FREQ,
+                  OLED_WIDTH, OLED_HEIGHT, OLED_ADDR)
+
+
+# Simple 5x8 ASCII font bitmap, 5 column bytes per glyph indexed by
+# ord(char) - 0x20. Characters without a glyph are left blank. Being a
+# const it lives in the compiled bytecode, so drawing text allocates nothing.
+_FONT_FIRST = const(0x20)
+_FONT_GLYPHS = const(96)  # ' ' through DEL
+_FONT = const(
+    b'\x00\x00\x00\x00\x00'  # ' '
+    b'\x00\x00\x00\x00\x00'  # '!'
+    b'\x00\x00\x00\x00\x00'  # '"'
+    b'\x00\x00\x00\x00\x00'  # '#'
+    b'\x00\x00\x00\x00\x00'  # '$'
+    b'\x00\x00\x00\x00\x00'  # '%'
+    b'\x00\x00\x00\x00\x00'  # '&'
+    b'\x00\x00\x00\x00\x00'  # "'"
+    b'\x00\x00\x00\x00\x00'  # '('
+    b'\x00\x00\x00\x00\x00'  # ')'
+    b'\x00\x00\x00\x00\x00'  # '*'
+    b'\x00\x00\x00\x00\x00'  # '+'
+    b'\x00\x00\x00\x00\x00'  # ','
+    b'\x08\x08\x08\x08\x08'  # '-'
+    b'\x00\x60\x60\x00\x00'  # '.'
+    b'\x00\x00\x00\x00\x00'  # '/'
+    b'\x3E\x51\x49\x45\x3E'  # '0'
+    b'\x00\x41\x7F\x40\x00'  # '1'
+    b'\x72\x49\x49\x49\x46'  # '2'
+    b'\x22\x49\x49\x49\x36'  # '3'
+    b'\x0F\x08\x08\x08\x7E'  # '4'
+    b'\x27\x45\x45\x45\x39'  # '5'
+    b'\x3C\x4A\x49\x49\x30'  # '6'
+    b'\x41\x21\x11\x09\x07'  # '7'
+    b'\x36\x49\x49\x49\x36'  # '8'
+    b'\x06\x49\x49\x29\x1E'  # '9'
+    b'\x00\x36\x36\x00\x00'  # ':'
+    b'\x00\x00\x00\x00\x00'  # ';'
+    b'\x00\x00\x00\x00\x00'  # '<'
+    b'\x00\x00\x00\x00\x00'  # '='
+    b'\x00\x00\x00\x00\x00'  # '>'
+    b'\x00\x00\x00\x00\x00'  # '?'
+    b'\x00\x00\x00\x00\x00'  # '@'
+    b'\x7E\x09\x09\x09\x7E'  # 'A'
+    b'\x7F\x49\x49\x49\x36'  # 'B'
+    b'\x3E\x41\x41\x41\x22'  # 'C'
+    b'\x7F\x41\x41\x41\x3E'  # 'D'
+    b'\x7F\x49\x49\x49\x41'  # 'E'
+    b'\x7F\x09\x09\x09\x01'  # 'F'
+    b'\x3E\x41\x49\x49\x32'  # 'G'
+    b'\x7F\x08\x08\x08\x7F'  # 'H'
+    b'\x00\x41\x7F\x41\x00'  # 'I'
+    b'\x20\x40\x41\x3F\x01'  # 'J'
+    b'\x7F\x08\x14\x22\x41'  # 'K'
+    b'\x7F\x40\x40\x40\x40'  # 'L'
+    b'\x7F\x02\x04\x02\x7F'  # 'M'
+    b'\x7F\x04\x08\x10\x7F'  # 'N'
+    b'\x3E\x41\x41\x41\x3E'  # 'O'
+    b'\x7F\x09\x09\x09\x06'  # 'P'
+    b'\x3E\x41\x51\x21\x5E'  # 'Q'
+    b'\x7F\x09\x19\x29\x46'  # 'R'
+    b'\x26\x49\x49\x49\x32'  # 'S'
+    b'\x01\x01\x7F\x01\x01'  # 'T'
+    b'\x3F\x40\x40\x40\x3F'  # 'U'
+    b'\x1F\x20\x40\x20\x1F'  # 'V'
+    b'\x7F\x20\x10\x20\x7F'  # 'W'
+    b'\x63\x14\x08\x14\x63'  # 'X'
+    b'\x07\x08\x70\x08\x07'  # 'Y'
+    b'\x61\x51\x49\x45\x43'  # 'Z'
+    b'\x00\x00\x00\x00\x00'  # '['
+    b'\x00\x00\x00\x00\x00'  # '\\'
+    b'\x00\x00\x00\x00\x00'  # ']'
+    b'\x00\x00\x00\x00\x00'  # '^'
+    b'\x00\x00\x00\x00\x00'  # '_'
+    b'\x00\x00\x00\x00\x00'  # '`'
+    b'\x00\x00\x00\x00\x00'  # 'a'
+    b'\x00\x00\x00\x00\x00'  # 'b'
+    b'\x00\x00\x00\x00\x00'  # 'c'
+    b'\x00\x00\x00\x00\x00'  # 'd'
+    b'\x00\x00\x00\x00\x00'  # 'e'
+    b'\x00\x00\x00\x00\x00'  # 'f'
+    b'\x00\x00\x00\x00\x00'  # 'g'
+    b'\x00\x00\x00\x00\x00'  # 'h'
+    b'\x00\x00\x00\x00\x00'  # 'i'
+    b'\x00\x00\x00\x00\x00'  # 'j'
+    b'\x00\x00\x00\x00\x00'  # 'k'
+    b'\x00\x00\x00\x00\x00'  # 'l'
+    b'\x00\x00\x00\x00\x00'  # 'm'
+    b'\x00\x00\x00\x00\x00'  # 'n'
+    b'\x00\x00\x00\x00\x00'  # 'o'
+    b'\x00\x00\x00\x00\x00'  # 'p'
+    b'\x00\x00\x00\x00\x00'  # 'q'
+    b'\x00\x00\x00\x00\x00'  # 'r'
+    b'\x00\x00\x00\x00\x00'  # 's'
+    b'\x00\x00\x00\x00\x00'  # 't'
+    b'\x00\x00\x00\x00\x00'  # 'u'
+    b'\x00\x00\x00\x00\x00'  # 'v'
+    b'\x00\x00\x00\x00\x00'  # 'w'
+    b'\x00\x00\x00\x00\x00'  # 'x'
+    b'\x00\x00\x00\x00\x00'  # 'y'
+    b'\x00\x00\x00\x00\x00'  # 'z'
+    b'\x00\x00\x00\x00\x00'  # '{'
+    b'\x00\x00\x00\x00\x00'  # '|'
+    b'\x00\x00\x00\x00\x00'  # '}'
+    b'\x00\x00\x00\x00\x00'  # '~'
+    b'\x00\x00\x00\x00\x00'  # DEL
+)
+
+
+# Viper drawing primitives. These compile to native Thumb code and work
+# directly on the frame buffer, which is page-organised: byte
+# (y // 8) * width + x holds 8 vertical pixels, LSB at the top.
+
+@micropython.viper
+def _pixel(buf: ptr8, width: int, height: int, x: int, y: int, color: int):
+    if x < 0 or x >= width or y < 0 or y >= height:
+        return
+    index = (y >> 3) * width + x
+    if color:
+        buf[index] = buf[index] | (1 << (y & 7))
+    else:
+        buf[index] = buf[index] & ~(1 << (y & 7))
+
+
+@micropython.viper
+def _hline(buf: ptr8, width: int, height: int, x: int, y: int, w: int, color: int):
+    if y < 0 or y >= height:
+        return
+    # A horizontal line is the same bit in consecutive bytes of one page
+    base = (y >> 3) * width
+    start = base + (x if x > 0 else 0)
+    end = base + (x + w if x + w < width else width)
+    bit = 1 << (y & 7)
+    if color:
+        for i in range(start, end):
+            buf[i] = buf[i] | bit
+    else:
+        bit = ~bit
+        for i in range(start, end):
+            buf[i] = buf[i] & bit
+
+
+@micropython.viper
+def _vline(buf: ptr8, width: int, height: int, x: int, y: int, h: int, color: int):
+    if x < 0 or x >= width:
+        return
+    row = y if y > 0 else 0
+    end = y + h if y + h < height else height
+    # Write one byte per page: a mask covering the rows of the line that
+    # fall inside that page
+    while row < end:
+        page_end = ((row >> 3) + 1) << 3
+        stop = page_end if page_end < end else end
+        mask = (0xFF << (row & 7)) & (0xFF >> (page_end - stop))
+        index = (row >> 3) * width + x
+        if color:
+            buf[index] = buf[index] | mask
+        else:
+            buf[index] = buf[index] & ~mask
+        row = stop
+
+
+@micropython.viper
+def _fill_rect(buf: ptr8, width: int, height: int, x: int, y: int, w: int, h: int, color: int):
+    start = x if x > 0 else 0
+    end = x + w if x + w < width else width
+    if start >= end:
+        return
+    row = y if y > 0 else 0
+    bottom = y + h if y + h < height else height
+    # Same page masks as _vline, applied across every column of the rect
+    while row < bottom:
+        page_end = ((row >> 3) + 1) << 3
+        stop = page_end if page_end < bottom else bottom
+        mask = (0xFF << (row & 7)) & (0xFF >> (page_end - stop))
+        base = (row >> 3) * width
+        if color:
+            for i in range(base + start, base + end):
+                buf[i] = buf[i] | mask
+        else:
+            mask = ~mask
+            for i in range(base + start, base + end):
+                buf[i] = buf[i] & mask
+        row = stop
+
+
+@micropython.viper
+def _glyph(buf: ptr8, width: int, height: int, char: int, x: int, y: int, color: int):
+    glyph = char - _FONT_FIRST
+    if glyph < 0 or glyph >= _FONT_GLYPHS:
+        return
+    font = ptr8(_FONT)
+    pages = height >> 3
+    # A glyph column is one byte; when y isn't page aligned it straddles
+    # two pages, so split it into a low and a high part
+    page = y >> 3
+    shift = y & 7
+    top = page * width
+    bottom = top + width
+    for col in range(5):
+        cx = x + col
+        if cx < 0 or cx >= width:
+            continue
+        col_data = font[glyph * 5 + col]
+        if page >= 0 and page < pages:
+            bits = (col_data << shift) & 0xFF
+            if color:
+                buf[top + cx] = buf[top + cx] | bits
+            else:
+                buf[top + cx] = buf[top + cx] & ~bits
+        if shift != 0 and page + 1 >= 0 and page + 1 < pages:
+            bits = col_data >> (8 - shift)
+            if color:
+                buf[bottom + cx] = buf[bottom + cx] | bits
+            else:
+                buf[bottom + cx] = buf[bottom + cx] & ~bits
 
 
 class SSD1306:
@@ -19,8 +236,14 @@ class SSD1306:
     LOWER_COLUMN_START = 0x00
     HIGHER_COLUMN_START = 0x10
     SET_START_LINE = 0x40
+    SET_COL_ADDR = 0x21
+    SET_PAGE_ADDR = 0x22
     
-    def __init__(self, width=128, height=64, i2c_id=0, sda=6, scl=7, addr=0x3C):
+    # I2C control bytes that prefix every command/data transaction
+    CMD_PREFIX = b'\x00'
+    DATA_PREFIX = b'\x40'
+    
+    def __init__(self, width=128, height=64, i2c_id=0, sda=6, scl=7, addr=0x3C, freq=1000000):
         """Initialize SSD1306 display
         
         Args:
@@ -30,15 +253,33 @@ class SSD1306:
             sda: SDA pin number
             scl: SCL pin number
             addr: I2C address of the display
+            freq: I2C bus frequency in Hz
         """
         self.width = width
         self.height = height
         self.addr = addr
-        self.i2c = I2C(i2c_id, scl=Pin(scl), sda=Pin(sda), freq=400000)
+        self.i2c = I2C(i2c_id, scl=Pin(scl), sda=Pin(sda), freq=freq)
         
-        # Frame buffer: height/8 pages * width bytes
+        # Frame buffer: height/8 pages * width bytes, prefixed with the 0x40
+        # data control byte so a whole frame goes out in one I2C transaction.
+        # self.buf is a zero-copy view of the pixel data after the prefix.
         self.pages = height // 8
-        self.buf = bytearray(self.pages * width)
+        self._framebuf = bytearray(1 + self.pages * width)
+        self._framebuf[0] = 0x40
+        self.buf = memoryview(self._framebuf)[1:]
+        
+        # Column/page window, sent as a single command transaction ahead of
+        # every block of page data. The page range (bytes 5 and 6) is
+        # filled in by show() for the pages being written.
+        self._window_cmd = bytearray([
+            0x00,                                   # Command control byte
+            self.SET_COL_ADDR, 0, width - 1,        # Column address range
+            self.SET_PAGE_ADDR, 0, self.pages - 1,  # Page address range
+        ])
+        
+        # Bitmask of pages changed since the last show() (bit n = page n)
+        self._all_pages = (1 << self.pages) - 1
+        self._dirty = self._all_pages
         
         # Initialize display
         self.init_display()
@@ -70,11 +311,9 @@ class SSD1306:
         """Write command(s) to display
         
         Args:
-            cmd: Single byte command or bytes object with commands
+            cmd: Bytes object with one or more commands
         """
-        if isinstance(cmd, int):
-            cmd = bytes([cmd])
-        self.i2c.writeto(self.addr, bytes([0x00]) + cmd)
+        self.i2c.writevto(self.addr, (self.CMD_PREFIX, cmd))
     
     def write_data(self, data):
         """Write data to display
@@ -82,24 +321,59 @@ class SSD1306:
         Args:
             data: Bytes to write to display memory
         """
-        self.i2c.writeto(self.addr, bytes([0x40]) + data)
+        self.i2c.writevto(self.addr, (self.DATA_PREFIX, data))
+    
+    def _mark_dirty(self, y, height):
+        """Flag the pages covering rows y to y + height - 1 for the next show()"""
+        top = y if y > 0 else 0
+        bottom = y + height - 1
+        if bottom >= self.height:
+            bottom = self.height - 1
+        if bottom < top:
+            return
+        first = top >> 3
+        self._dirty |= ((1 << ((bottom >> 3) - first + 1)) - 1) << first
     
     def show(self):
-        """Display the frame buffer"""
-        for page in range(self.pages):
-            self.write_cmd(self.SETPAGE | page)
-            self.write_cmd(0x00)  # Column start address
-            self.write_cmd(0x10)
-            
-            # Write one page of data
-            page_start = page * self.width
-            page_end = page_start + self.width
-            self.write_data(self.buf[page_start:page_end])
+        """Display the changed pages of the frame buffer"""
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = 0
+        
+        # Horizontal addressing mode is set in init_display, so after setting
+        # the column/page window a run of pages can be written in one go
+        writeto = self.i2c.writeto
+        addr = self.addr
+        window = self._window_cmd
+        if dirty == self._all_pages:
+            window[5] = 0
+            window[6] = self.pages - 1
+            writeto(addr, window)
+            writeto(addr, self._framebuf)
+            return
+        
+        buf = self.buf
+        width = self.width
+        write_data = self.write_data
+        page = 0
+        while dirty:
+            if not dirty & 1:
+                dirty >>= 1
+                page += 1
+                continue
+            first = page
+            while dirty & 1:
+                dirty >>= 1
+                page += 1
+            window[5] = first
+            window[6] = page - 1
+            writeto(addr, window)
+            write_data(buf[first * width:page * width])
     
     def clear(self):
         """Clear the entire display"""
-        self.buf[:] = bytearray(len(self.buf))
-        self.show()
+        self.fill(0)
     
     def fill(self, color):
         """Fill the entire display with a color
@@ -107,8 +381,9 @@ class SSD1306:
         Args:
             color: 1 for white, 0 for black
         """
-        fill_byte = 0xFF if color else 0x00
-        self.buf[:] = bytearray([fill_byte] * len(self.buf))
+        # Fill in place rather than copying from a temporary buffer
+        _fill_rect(self.buf, self.width, self.height, 0, 0, self.width, self.height, color)
+        self._dirty = self._all_pages
         self.show()
     
     def pixel(self, x, y, state=1):
@@ -119,17 +394,8 @@ class SSD1306:
             y: Y coordinate (0-63)
             state: 1 to set pixel, 0 to clear
         """
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return
-        
-        page = y // 8
-        bit = y % 8
-        index = page * self.width + x
-        
-        if state:
-            self.buf[index] |= (1 << bit)
-        else:
-            self.buf[index] &= ~(1 << bit)
+        _pixel(self.buf, self.width, self.height, x, y, state)
+        self._mark_dirty(y, 1)
     
     def hline(self, x, y, width, color):
         """Draw a horizontal line
@@ -140,8 +406,8 @@ class SSD1306:
             width: Line width in pixels
             color: 1 for white, 0 for black
         """
-        for i in range(width):
-            self.pixel(x + i, y, color)
+        _hline(self.buf, self.width, self.height, x, y, width, color)
+        self._mark_dirty(y, 1)
     
     def vline(self, x, y, height, color):
         """Draw a vertical line
@@ -152,8 +418,8 @@ class SSD1306:
             height: Line height in pixels
             color: 1 for white, 0 for black
         """
-        for i in range(height):
-            self.pixel(x, y + i, color)
+        _vline(self.buf, self.width, self.height, x, y, height, color)
+        self._mark_dirty(y, height)
     
     def rect(self, x, y, width, height, color, fill=False):
         """Draw a rectangle
@@ -167,8 +433,8 @@ class SSD1306:
             fill: True to fill the rectangle
         """
         if fill:
-            for i in range(height):
-                self.hline(x, y + i, width, color)
+            _fill_rect(self.buf, self.width, self.height, x, y, width, height, color)
+            self._mark_dirty(y, height)
         else:
             self.hline(x, y, width, color)
             self.hline(x, y + height - 1, width, color)
@@ -184,58 +450,14 @@ class SSD1306:
             y: Starting Y coordinate
             color: 1 for white, 0 for black
         """
-        # Simple 5x8 ASCII font bitmap
-        font_data = {
-            ' ': [0x00, 0x00, 0x00, 0x00, 0x00],
-            '0': [0x3E, 0x51, 0x49, 0x45, 0x3E],
-            '1': [0x00, 0x41, 0x7F, 0x40, 0x00],
-            '2': [0x72, 0x49, 0x49, 0x49, 0x46],
-            '3': [0x22, 0x49, 0x49, 0x49, 0x36],
-            '4': [0x0F, 0x08, 0x08, 0x08, 0x7E],
-            '5': [0x27, 0x45, 0x45, 0x45, 0x39],
-            '6': [0x3C, 0x4A, 0x49, 0x49, 0x30],
-            '7': [0x41, 0x21, 0x11, 0x09, 0x07],
-            '8': [0x36, 0x49, 0x49, 0x49, 0x36],
-            '9': [0x06, 0x49, 0x49, 0x29, 0x1E],
-            'A': [0x7E, 0x09, 0x09, 0x09, 0x7E],
-            'B': [0x7F, 0x49, 0x49, 0x49, 0x36],
-            'C': [0x3E, 0x41, 0x41, 0x41, 0x22],
-            'D': [0x7F, 0x41, 0x41, 0x41, 0x3E],
-            'E': [0x7F, 0x49, 0x49, 0x49, 0x41],
-            'F': [0x7F, 0x09, 0x09, 0x09, 0x01],
-            'G': [0x3E, 0x41, 0x49, 0x49, 0x32],
-            'H': [0x7F, 0x08, 0x08, 0x08, 0x7F],
-            'I': [0x00, 0x41, 0x7F, 0x41, 0x00],
-            'J': [0x20, 0x40, 0x41, 0x3F, 0x01],
-            'K': [0x7F, 0x08, 0x14, 0x22, 0x41],
-            'L': [0x7F, 0x40, 0x40, 0x40, 0x40],
-            'M': [0x7F, 0x02, 0x04, 0x02, 0x7F],
-            'N': [0x7F, 0x04, 0x08, 0x10, 0x7F],
-            'O': [0x3E, 0x41, 0x41, 0x41, 0x3E],
-            'P': [0x7F, 0x09, 0x09, 0x09, 0x06],
-            'Q': [0x3E, 0x41, 0x51, 0x21, 0x5E],
-            'R': [0x7F, 0x09, 0x19, 0x29, 0x46],
-            'S': [0x26, 0x49, 0x49, 0x49, 0x32],
-            'T': [0x01, 0x01, 0x7F, 0x01, 0x01],
-            'U': [0x3F, 0x40, 0x40, 0x40, 0x3F],
-            'V': [0x1F, 0x20, 0x40, 0x20, 0x1F],
-            'W': [0x7F, 0x20, 0x10, 0x20, 0x7F],
-            'X': [0x63, 0x14, 0x08, 0x14, 0x63],
-            'Y': [0x07, 0x08, 0x70, 0x08, 0x07],
-            'Z': [0x61, 0x51, 0x49, 0x45, 0x43],
-            ':': [0x00, 0x36, 0x36, 0x00, 0x00],
-            '.': [0x00, 0x60, 0x60, 0x00, 0x00],
-            '-': [0x08, 0x08, 0x08, 0x08, 0x08],
-        }
-        
+        buf = self.buf
+        width = self.width
+        height = self.height
         current_x = x
         for char in string:
-            if char in font_data:
-                for bit_col, col_data in enumerate(font_data[char]):
-                    for bit_row in range(8):
-                        if col_data & (1 << bit_row):
-                            self.pixel(current_x + bit_col, y + bit_row, color)
+            _glyph(buf, width, height, ord(char), current_x, y, color)
             current_x += 6  # Character width + spacing
+        self._mark_dirty(y, 8)
 
 
 class Display:
@@ -244,25 +466,46 @@ class Display:
     def __init__(self):
         """Initialize the display"""
         try:
-            self.oled = SSD1306(
-                width=OLED_WIDTH,
-                height=OLED_HEIGHT,
-                i2c_id=OLED_I2C_ID,
-                sda=OLED_SDA,
-                scl=OLED_SCL,
-                addr=OLED_ADDR
-            )
+            try:
+                self.oled = self._create_oled(OLED_I2C_FREQ)
+            except OSError:
+                # Not every SSD1306 clone (or SH1106) ACKs at 1MHz
+                print(f"Display not responding at {OLED_I2C_FREQ}Hz, retrying at {OLED_I2C_FALLBACK_FREQ}Hz")
+                self.oled = self._create_oled(OLED_I2C_FALLBACK_FREQ)
             self.initialized = True
             print("Display initialized successfully")
         except Exception as e:
             print(f"Failed to initialize display: {e}")
             self.initialized = False
+        
+        # Screen currently drawn and the values shown on the status screen,
+        # so show_status() only redraws what changed
+        self._screen = None
+        self._status_volume = None
+        self._status_keys = None
+    
+    def _create_oled(self, freq):
+        """Create the SSD1306 driver on the configured bus
+        
+        Args:
+            freq: I2C bus frequency in Hz
+        """
+        return SSD1306(
+            width=OLED_WIDTH,
+            height=OLED_HEIGHT,
+            i2c_id=OLED_I2C_ID,
+            sda=OLED_SDA,
+            scl=OLED_SCL,
+            addr=OLED_ADDR,
+            freq=freq
+        )
     
     def show_welcome(self):
         """Display welcome screen"""
         if not self.initialized:
             return
         
+        self._screen = 'welcome'
         self.oled.clear()
         self.oled.text("MICROPAD v1.0", 20, 5)
         self.oled.text("XIAO RP2040", 25, 20)
@@ -270,44 +513,67 @@ class Display:
         self.oled.text("6 Keys + Encoder", 15, 42)
         self.oled.show()
     
-    def show_status(self, encoder_value=0, active_keys=None):
+    def show_status(self, encoder_value=0, active_bits=0):
         """Display current status
         
         Args:
             encoder_value: Current encoder value
-            active_keys: List of active switch names
+            active_bits: Bitmask of active switches (bit n = switch n+1)
         """
         if not self.initialized:
             return
         
-        self.oled.clear()
+        oled = self.oled
+        text = oled.text
+        rect = oled.rect
+        
+        volume_bar_length = encoder_value % 20  # Clamp to 0-19
         
-        # Title
-        self.oled.text("STATUS", 50, 0)
-        self.oled.hline(0, 10, 128, 1)
+        if self._screen != 'status':
+            self._screen = 'status'
+            self._status_volume = None
+            self._status_keys = None
+            oled.clear()
+            
+            # Title
+            text("STATUS", 50, 0)
+            oled.hline(0, 10, 128, 1)
+            
+            # Footer
+            oled.hline(0, 55, 128, 1)
+            text("Ready", 50, 58)
+        elif volume_bar_length == self._status_volume and active_bits == self._status_keys:
+            return
         
         # Volume level (encoder value)
-        volume_bar_length = encoder_value % 20  # Clamp to 0-19
-        self.oled.text(f"VOL: {volume_bar_length}", 5, 15)
-        # Draw volume bar
-        self.oled.rect(40, 15, 80, 8, 1, fill=False)
-        bar_width = int((volume_bar_length / 20.0) * 76)
-        if bar_width > 0:
-            self.oled.rect(42, 17, bar_width, 4, 1, fill=True)
+        if volume_bar_length != self._status_volume:
+            self._status_volume = volume_bar_length
+            rect(0, 15, 128, 8, 0, fill=True)
+            text(f"VOL: {volume_bar_length}", 5, 15)
+            # Draw volume bar
+            rect(40, 15, 80, 8, 1, fill=False)
+            bar_width = int((volume_bar_length / 20.0) * 76)
+            if bar_width > 0:
+                rect(42, 17, bar_width, 4, 1, fill=True)
         
         # Active keys indicator
-        key_display = "Keys:"
-        if active_keys:
-            key_display += " " + ",".join(active_keys)
-        else:
-            key_display += " None"
-        self.oled.text(key_display, 5, 30)
-        
-        # Footer
-        self.oled.hline(0, 55, 128, 1)
-        self.oled.text("Ready", 50, 58)
+        if active_bits != self._status_keys:
+            self._status_keys = active_bits
+            key_display = "Keys:"
+            if active_bits:
+                key_number = 1
+                bits = active_bits
+                while bits:
+                    if bits & 1:
+                        key_display += " " + str(key_number)
+                    bits >>= 1
+                    key_number += 1
+            else:
+                key_display += " None"
+            rect(0, 30, 128, 8, 0, fill=True)
+            text(key_display, 5, 30)
         
-        self.oled.show()
+        oled.show()
     
     def show_debug_info(self, info_dict):
         """Display debug information
@@ -318,9 +584,11 @@ class Display:
         if not self.initialized:
             return
         
-        self.oled.clear()
-        self.oled.text("DEBUG INFO", 35, 0)
-        self.oled.hline(0, 10, 128, 1)
+        oled = self.oled
+        self._screen = 'debug'
+        oled.clear()
+        oled.text("DEBUG INFO", 35, 0)
+        oled.hline(0, 10, 128, 1)
         
         y_pos = 15
         for key, value in info_dict.items():
@@ -328,10 +596,10 @@ class Display:
                 text = f"{key}: {value}"
                 if len(text) > 20:
                     text = text[:20]
-                self.oled.text(text, 5, y_pos)
+                oled.text(text, 5, y_pos)
                 y_pos += 10
         
-        self.oled.show()
+        oled.show()
     
     def show_key_press(self, key_name):
         """Display key press indication
@@ -342,6 +610,7 @@ class Display:
         if not self.initialized:
             return
         
+        self._screen = 'key_press'
         self.oled.clear()
         self.oled.rect(10, 10, 108, 44, 1, fill=False)
         self.oled.text("KEY PRESSED", 32, 20)
@@ -351,4 +620,5 @@ class Display:
     def clear(self):
         """Clear the display"""
         if self.initialized:
+            self._screen = None
             self.oled.clear()
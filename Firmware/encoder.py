@@ -1,6 +1,23 @@
 import time
+import micropython
+from micropython import const
 from machine import Pin, Timer
-from pins import ENCODER_CLK, ENCODER_DT, ENCODER_SW, ENCODER_DEBOUNCE_TIME
+from pins import ENCODER_CLK, ENCODER_DT, ENCODER_SW
+
+
+# RP2040 SIO GPIO_IN register: bit n is the input level of GPIOn
+_SIO_GPIO_IN = const(0xD0000004)
+
+# Quadrature state AB = (CLK << 1) | DT. Indexed by (previous AB << 2) | AB,
+# this gives +1 for a clockwise quarter step, 0xFF (-1) for counter-clockwise
+# and 0 for no change or an impossible jump (contact bounce).
+_TRANSITIONS = const(
+    b'\x00\xFF\x01\x00'  # from 00
+    b'\x01\x00\x00\xFF'  # from 01
+    b'\xFF\x00\x00\x01'  # from 10
+    b'\x00\x01\xFF\x00'  # from 11
+)
+_DETENT = const(3)  # AB at rest (both contacts open, pulled high)
 
 
 class EC11Encoder:
@@ -25,45 +42,70 @@ class EC11Encoder:
         self.sw = Pin(ENCODER_SW, Pin.IN, Pin.PULL_UP)
         
         # State tracking
-        self.last_clk = self.clk.value()
-        self.last_dt = self.dt.value()
+        self._ab = (self.clk.value() << 1) | self.dt.value()
+        self._steps = 0  # Quarter steps since the last detent
         self.last_sw = self.sw.value()
-        self.last_interrupt_time = 0
         self.button_press_time = 0
         
-        # Setup interrupts with debouncing
-        self.clk.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._handle_rotation)
+        # Setup interrupts; every edge on either contact is decoded, which
+        # also filters out bounce without a time based debounce. These are
+        # hard IRQs so the contacts are sampled at the edge, not after
+        # whatever the main loop is busy with; the rotation path (including
+        # callback_rotate) must not allocate.
+        self.clk.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._handle_rotation, hard=True)
+        self.dt.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._handle_rotation, hard=True)
         self.sw.irq(trigger=Pin.IRQ_FALLING, handler=self._handle_button)
     
-    def _handle_rotation(self, pin):
-        """Handle encoder rotation with debouncing"""
-        # Simple debounce using time delay
-        current_time = time.ticks_ms()
-        if current_time - self.last_interrupt_time < ENCODER_DEBOUNCE_TIME:
-            return
-        
-        self.last_interrupt_time = current_time
+    @micropython.viper
+    def _decode(self) -> int:
+        """Decode the latest CLK/DT transition
         
-        clk_val = self.clk.value()
-        dt_val = self.dt.value()
+        Reads both contacts in one go from the SIO register and returns 1 or
+        -1 when the encoder settles on a detent after a clockwise or
+        counter-clockwise click, otherwise 0.
+        """
+        gpio = ptr32(_SIO_GPIO_IN)[0]
+        ab = (((gpio >> int(ENCODER_CLK)) & 1) << 1) | ((gpio >> int(ENCODER_DT)) & 1)
+        prev = int(self._ab)
+        self._ab = ab
+        step = int(ptr8(_TRANSITIONS)[(prev << 2) | ab])
+        if step > 127:
+            step -= 256
+        steps = int(self._steps) + step
+        if ab != _DETENT:
+            self._steps = steps
+            return 0
         
-        # Detect rotation direction using state machine
-        if clk_val != self.last_clk:
-            if clk_val == 0:  # Falling edge on CLK
-                if dt_val == 1:  # DT is high when CLK goes low = clockwise
-                    if self.callback_rotate:
-                        self.callback_rotate(1)
-                else:  # DT is low when CLK goes low = counter-clockwise
-                    if self.callback_rotate:
-                        self.callback_rotate(-1)
+        # Back on the detent: always close out the click here
+        self._steps = 0
+        if step == 0 and prev != ab:
+            # Jumped straight across from 00, so two edges were missed;
+            # they count in the direction travelled so far
+            if steps > 0:
+                steps += 2
+            elif steps < 0:
+                steps -= 2
         
-        self.last_clk = clk_val
-        self.last_dt = dt_val
+        # A full click is 4 quarter steps; accept 2 or more so a missed
+        # edge doesn't drop the click
+        if steps >= 2:
+            return 1
+        if steps <= -2:
+            return -1
+        return 0
+    
+    def _handle_rotation(self, pin):
+        """Handle encoder rotation"""
+        direction = self._decode()
+        if direction:
+            callback_rotate = self.callback_rotate
+            if callback_rotate:
+                callback_rotate(direction)
     
     def _handle_button(self, pin):
         """Handle encoder button press with debouncing"""
         current_time = time.ticks_ms()
-        if current_time - self.button_press_time < 50:  # 50ms debounce for button
+        if time.ticks_diff(current_time, self.button_press_time) < 50:  # 50ms debounce for button
             return
         
         self.button_press_time = current_time
@@ -26,6 +26,15 @@ class MediaControl:
         """Initialize media control"""
         self.enabled = HID_AVAILABLE
         
+        # Consumer Control HID format: [code_low, code_high, 0]
+        # Reports never change, so build them once instead of per keypress
+        self._reports = {
+            code: bytes([code & 0xFF, (code >> 8) & 0xFF, 0])
+            for code in (self.VOLUME_UP, self.VOLUME_DOWN, self.VOLUME_MUTE,
+                         self.PLAY_PAUSE, self.NEXT_TRACK, self.PREV_TRACK)
+        }
+        self._release = bytes(3)
+        
         if self.enabled:
             try:
                 # Get the HID keyboard device
@@ -145,24 +154,23 @@ class MediaControl:
             return
         
         try:
-            # Consumer Control HID format: [report_id, code_low, code_high, 0]
-            # Report format: 3-byte report with media control code
-            report = bytes([code & 0xFF, (code >> 8) & 0xFF, 0])
+            report = self._reports[code]
             
-            # Send press
+            # Send press, held for one USB full-speed frame (1ms) so the
+            # host polls it before the release
             self.keyboard.send(report)
-            time.sleep(0.05)  # 50ms
+            time.sleep_ms(1)
             
             # Send release (zeros)
-            self.keyboard.send(bytes([0, 0, 0]))
+            self.keyboard.send(self._release)
             
         except AttributeError:
             # Device might not support send() method
             try:
                 # Try alternative method using write()
                 self.keyboard.write(report)
-                time.sleep(0.05)
-                self.keyboard.write(bytes([0, 0, 0]))
+                time.sleep_ms(1)
+                self.keyboard.write(self._release)
             except Exception as e:
                 print(f"Could not send HID report: {e}")
         except Exception as e:
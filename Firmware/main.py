@@ -1,44 +1,54 @@
 import time
-from machine import Pin
-from pins import SWITCH_PINS, DEBOUNCE_TIME
+import micropython
+from array import array
+from machine import Pin, disable_irq, enable_irq
+from pins import SWITCH_PINS, SWITCH_NAMES, DEBOUNCE_TIME
 from encoder import EC11Encoder
 from display import Display
 from hid_control import init_media_control, get_media_control
 
+# Lets exceptions raised in hard IRQ handlers (encoder rotation) be reported
+micropython.alloc_emergency_exception_buf(100)
+
 
 class SwitchHandler:
     """Handler for MX-style switches with debouncing"""
     
     def __init__(self):
-        self.pins = {}
-        self.last_press_time = {}
-        self.press_callbacks = {}
-        self.states = {}
+        # Per-switch state lives in parallel arrays indexed like SWITCH_NAMES
+        # so the IRQ handler indexes by int instead of hashing the switch name.
+        # Press times are a packed int32 array (ticks_ms values fit in 30 bits)
+        # and pressed switches are bits of state_bits (bit n = index n).
+        count = len(SWITCH_NAMES)
+        self.pins = [Pin(SWITCH_PINS[name], Pin.IN, Pin.PULL_UP) for name in SWITCH_NAMES]
+        self.last_press_time = array('l', [0] * count)
+        self.press_callbacks = [None] * count
+        self.state_bits = 0
         
-        # Initialize all switch pins
-        for name, pin_num in SWITCH_PINS.items():
-            self.pins[name] = Pin(pin_num, Pin.IN, Pin.PULL_UP)
-            self.last_press_time[name] = 0
-            self.states[name] = False
-            self.pins[name].irq(
+        # Initialize all switch interrupts
+        handler = self._handle_switch_press
+        for index, pin in enumerate(self.pins):
+            pin.irq(
                 trigger=Pin.IRQ_FALLING,
-                handler=lambda pin, name=name: self._handle_switch_press(name, pin)
+                handler=lambda pin, index=index: handler(index, pin)
             )
     
-    def _handle_switch_press(self, switch_name, pin):
+    def _handle_switch_press(self, index, pin):
         """Handle switch press with debouncing"""
-        current_time = time.ticks_ms()
+        current_time = _ticks_ms()
+        last_press_time = self.last_press_time
         
         # Debounce check
-        if current_time - self.last_press_time[switch_name] < DEBOUNCE_TIME:
+        if _ticks_diff(current_time, last_press_time[index]) < DEBOUNCE_TIME:
             return
         
-        self.last_press_time[switch_name] = current_time
-        self.states[switch_name] = True
+        last_press_time[index] = current_time
+        self.state_bits |= 1 << index
         
         # Call registered callback if exists
-        if switch_name in self.press_callbacks:
-            self.press_callbacks[switch_name](switch_name)
+        callback = self.press_callbacks[index]
+        if callback:
+            callback(SWITCH_NAMES[index])
     
     def register_callback(self, switch_name, callback):
         """Register a callback function for a switch
@@ -47,18 +57,23 @@ class SwitchHandler:
             switch_name: Name of the switch (switch_1 through switch_6)
             callback: Function to call when switch is pressed, receives switch_name as argument
         """
-        if switch_name in self.pins:
-            self.press_callbacks[switch_name] = callback
-    
-    def get_active_switches(self):
-        """Get list of currently active switches"""
-        return [name for name, state in self.states.items() if state]
+        if switch_name in SWITCH_NAMES:
+            self.press_callbacks[SWITCH_NAMES.index(switch_name)] = callback
     
     def reset_states(self):
         """Reset all switch states"""
-        for name in self.states:
-            self.states[name] = False
+        self.state_bits = 0
+
 
+# Status screen refresh interval when there is no input (ms)
+DISPLAY_REFRESH_INTERVAL = 1000
+# Main loop sleep between polls (ms)
+LOOP_INTERVAL = 100
+
+# Bound once so hot paths skip the attribute lookup on the time module
+_ticks_ms = time.ticks_ms
+_ticks_diff = time.ticks_diff
+_schedule = micropython.schedule
 
 # Global instances
 switch_handler = None
@@ -67,6 +82,10 @@ display = None
 media_control = None
 encoder_value = 0
 last_display_update = 0
+volume_delta = 0  # Encoder steps not yet sent as volume HID reports
+ui_dirty = False  # Set by input callbacks when the status screen is stale
+volume_drain_pending = False  # send_volume_steps() is queued with the scheduler
+volume_sending = False  # send_volume_steps() is running
 
 
 def init_display():
@@ -87,7 +106,7 @@ def init_switches(switch_callback=None):
     switch_handler = SwitchHandler()
     
     if switch_callback:
-        for switch_name in SWITCH_PINS.keys():
+        for switch_name in SWITCH_NAMES:
             switch_handler.register_callback(switch_name, switch_callback)
 
 
@@ -105,6 +124,7 @@ def init_encoder(rotate_callback=None, button_callback=None):
     )
 
 
+@micropython.native
 def on_switch_press(switch_name):
     """Callback for switch press"""
     print(f"Switch pressed: {switch_name}")
@@ -112,44 +132,95 @@ def on_switch_press(switch_name):
         display.show_key_press(switch_name)
 
 
+@micropython.native
 def on_encoder_rotate(direction):
-    """Callback for encoder rotation"""
-    global encoder_value, media_control
-    encoder_value += direction
+    """Callback for encoder rotation
     
-    if media_control and media_control.enabled:
-        if direction > 0:
-            # Clockwise = Volume Up
-            media_control.volume_up()
-        else:
-            # Counter-clockwise = Volume Down
-            media_control.volume_down()
+    Runs from the encoder's hard IRQ, so it only records the step and must
+    not allocate; the HID reports are sent by send_volume_steps(), which is
+    scheduled to run as soon as the main thread is free (including while
+    it is in time.sleep_ms).
+    """
+    global encoder_value, volume_delta, ui_dirty, volume_drain_pending
+    encoder_value += direction
+    volume_delta += direction
+    ui_dirty = True
     
-    print(f"Encoder: {encoder_value} (rotated {direction})")
+    if not volume_drain_pending:
+        volume_drain_pending = True
+        try:
+            _schedule(send_volume_steps, None)
+        except RuntimeError:
+            # Scheduler queue full; the main loop drains on its next pass
+            volume_drain_pending = False
 
 
 def on_encoder_button():
-    """Callback for encoder button press"""
-    print("Encoder button pressed")
-    global encoder_value
+    """Callback for encoder button press
+    
+    Runs from the encoder IRQ; the reset shows up on the next status redraw.
+    """
+    global encoder_value, ui_dirty
     encoder_value = 0
-    print("Encoder value reset to 0")
+    ui_dirty = True
 
 
+@micropython.native
 def update_display():
-    """Update display with current status"""
-    global last_display_update
-    current_time = time.ticks_ms()
+    """Update display with current status
+    
+    Redraws as soon as an input callback flags the UI as dirty, otherwise
+    every DISPLAY_REFRESH_INTERVAL.
+    """
+    global last_display_update, ui_dirty
+    current_time = _ticks_ms()
     
-    # Update display every 500ms
-    if current_time - last_display_update > 500:
+    if ui_dirty or _ticks_diff(current_time, last_display_update) >= DISPLAY_REFRESH_INTERVAL:
+        # Clear the flag before reading state so input arriving mid-update
+        # triggers another redraw on the next pass
+        ui_dirty = False
         last_display_update = current_time
         if display and display.initialized:
-            active_keys = switch_handler.get_active_switches()
-            display.show_status(encoder_value, active_keys)
+            display.show_status(encoder_value, switch_handler.state_bits)
             switch_handler.reset_states()
 
 
+def send_volume_steps(_arg=None):
+    """Send the volume steps accumulated by the encoder since the last call
+    
+    Scheduled from on_encoder_rotate() and also called once per main loop
+    pass as a fallback.
+    
+    Args:
+        _arg: Unused, required by micropython.schedule
+    """
+    global volume_delta, volume_drain_pending, volume_sending
+    volume_drain_pending = False
+    
+    # Scheduled calls can run inside the sleep between a press and release
+    # report below; the outer call picks up those steps instead
+    if volume_sending:
+        return
+    volume_sending = True
+    try:
+        while True:
+            # Take and reset the count with IRQs off so no step is lost in between
+            irq_state = disable_irq()
+            delta = volume_delta
+            volume_delta = 0
+            enable_irq(irq_state)
+            
+            if not delta or not (media_control and media_control.enabled):
+                return
+            
+            # Clockwise = Volume Up, counter-clockwise = Volume Down
+            step = media_control.volume_up if delta > 0 else media_control.volume_down
+            for _ in range(abs(delta)):
+                step()
+    finally:
+        volume_sending = False
+
+
 def main():
     """Main program"""
     global media_control
@@ -185,8 +256,9 @@ def main():
     # Main loop
     try:
         while True:
+            send_volume_steps()
             update_display()
-            time.sleep(0.05)  # 20ms polling interval
+            time.sleep_ms(LOOP_INTERVAL)
     except KeyboardInterrupt:
         print("\n\nProgram stopped by user")
     except Exception as e:
@@ -11,6 +11,9 @@ SWITCH_PINS = {
     'switch_6': 5,   # GPIO5 - D5
 }
 
+# Switch names in index order (switch handlers refer to switches by index)
+SWITCH_NAMES = ('switch_1', 'switch_2', 'switch_3', 'switch_4', 'switch_5', 'switch_6')
+
 # EC11 Rotary Encoder pins
 ENCODER_CLK = 28    # GPIO28 - D8 (Clock signal)
 ENCODER_DT = 27     # GPIO27 - D7 (Data signal)
@@ -20,7 +23,8 @@ ENCODER_SW = 26     # GPIO26 - D6 (Switch/Button)
 OLED_SDA = 6        # GPIO6 - D4 (I2C SDA)
 OLED_SCL = 7        # GPIO7 - D5 (I2C SCL)
 OLED_I2C_ID = 0     # I2C bus 0
-OLED_I2C_FREQ = 400000  # 400kHz
+OLED_I2C_FREQ = 1000000  # 1MHz (Fast-mode Plus)
+OLED_I2C_FALLBACK_FREQ = 400000  # 400kHz for modules that can't keep up
 
 # Display settings
 OLED_WIDTH = 128
@@ -29,6 +33,3 @@ OLED_ADDR = 0x3C    # I2C address for SSD1306
 
 # Debounce time in milliseconds
 DEBOUNCE_TIME = 20
-
-# Encoder settings
-ENCODER_DEBOUNCE_TIME = 2  # ms for encoder contacts